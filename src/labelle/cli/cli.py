@@ -11,8 +11,6 @@ from pathlib import Path
 from typing import List, NoReturn, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
 from typing_extensions import Annotated
 
 from labelle import __version__
@@ -83,6 +81,8 @@ def get_device_manager() -> DeviceManager:
     try:
         device_manager.scan()
     except DeviceManagerNoDevices as e:
+        from rich.console import Console
+
         err_console = Console(stderr=True)
         err_console.print(f"Error: {e}")
         raise typer.Exit() from e
@@ -94,6 +94,11 @@ app = typer.Typer()
 
 @app.command(hidden=True)
 def list_devices() -> NoReturn:
+    # Rich is only needed here and for error messages, so it is imported lazily
+    # to keep it out of the startup time of every other command.
+    from rich.console import Console
+    from rich.table import Table
+
     device_manager = get_device_manager()
     console = Console()
     headers = ["Manufacturer", "Product", "Serial Number", "USB"]
@@ -525,6 +530,8 @@ def default(
         line = sys.stdin.readline().strip()
         parts = line.split(":", 1)
         if not (parts[0] == "LABELLE-LABEL-SPEC-VERSION" and parts[1] == "1"):
+            from rich.console import Console
+
             err_console = Console(stderr=True)
             err_console.print(
                 "Error: Batch doesn't begin with LABELLE-LABEL-SPEC-VERSION:1"
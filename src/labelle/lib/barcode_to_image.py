@@ -6,12 +6,15 @@
 # this notice are preserved.
 # === END LICENSE STATEMENT ===
 
+import re
 from typing import List, Tuple, Union
 
 from PIL import Image, ImageDraw
 
 from labelle.lib.barcode_writer import BinaryString
 
+_RUNS_RE = re.compile("1+|0+")
+
 
 def _mm2px(mm: float, dpi: float = 25.4) -> float:
     return (mm * dpi) / 25.4
@@ -21,18 +24,7 @@ def _list_of_runs(line: BinaryString) -> List[int]:
     # Pack line to list give better gfx result, otherwise in can
     # result in aliasing gaps
     # '11010111' -> [2, -1, 1, -1, 3]
-    c = 1
-    mlist = []
-    for i in range(0, len(line)):
-        if i + 1 < len(line) and line[i] == line[i + 1]:
-            c += 1
-        else:
-            if line[i] == "1":
-                mlist.append(c)
-            else:
-                mlist.append(-c)
-            c = 1
-    return mlist
+    return [len(run) if run[0] == "1" else -len(run) for run in _RUNS_RE.findall(line)]
 
 
 def _calculate_size(
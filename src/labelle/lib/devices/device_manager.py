@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
+from operator import itemgetter
 
+import usb
 from usb.core import NoBackendError, USBError
 
 from labelle.lib.constants import (
@@ -22,66 +24,123 @@ class DeviceManagerNoDevices(DeviceManagerError):
     pass
 
 
+def _usb_topology_fingerprint(
+    usb_devices: list[usb.core.Device],
+) -> frozenset[tuple[int, int, int, int]]:
+    """Identify the set of attached devices without reading string descriptors."""
+    return frozenset(
+        (dev.bus, dev.address, dev.idVendor, dev.idProduct) for dev in usb_devices
+    )
+
+
 class DeviceManager:
     _devices: dict[str, UsbDevice]
+    _sorted_devices: list[UsbDevice] | None
+    _last_topology: frozenset[tuple[int, int, int, int]] | None
 
     def __init__(self) -> None:
         self._devices = {}
+        self._sorted_devices = None
+        self._last_topology = None
+
+    def _clear_devices(self) -> None:
+        self._devices.clear()
+        self._sorted_devices = None
+        self._last_topology = None
 
     def scan(self) -> bool:
-        prev = self._devices
         try:
-            cur = {dev.hash: dev for dev in UsbDevice.supported_devices() if dev.hash}
+            usb_devices = UsbDevice.find_supported_usb_devices()
+            topology = _usb_topology_fingerprint(usb_devices)
+            if self._devices and topology == self._last_topology:
+                # Nothing was plugged or unplugged since the last scan
+                return False
+            cur = {}
+            for dev in map(UsbDevice, usb_devices):
+                dev_hash = dev.hash
+                if dev_hash:
+                    cur[dev_hash] = dev
         except POSSIBLE_USB_ERRORS as e:
-            self._devices.clear()
+            self._clear_devices()
             raise DeviceManagerError(f"Failed scanning devices: {e}") from e
         if len(cur) == 0:
-            self._devices.clear()
+            self._clear_devices()
             raise DeviceManagerNoDevices("No supported devices found")
-
-        prev_set = set(prev)
-        cur_set = set(cur)
-
-        for dev in prev_set - cur_set:
-            self._devices.pop(dev)
-        for dev in cur_set - prev_set:
-            self._devices[dev] = cur[dev]
-
-        changed = prev_set != cur_set
+        self._last_topology = topology
+
+        changed = False
+        for key in list(self._devices):
+            if key not in cur:
+                del self._devices[key]
+                changed = True
+        for key, dev in cur.items():
+            if key not in self._devices:
+                self._devices[key] = dev
+                changed = True
+
+        if changed:
+            self._sorted_devices = None
         return changed
 
     @property
     def devices(self) -> list[UsbDevice]:
-        try:
-            return sorted(self._devices.values(), key=lambda dev: dev.hash)
-        except POSSIBLE_USB_ERRORS:
-            return []
+        if self._sorted_devices is None:
+            if len(self._devices) <= 1:
+                # The common case of zero or one attached labeler needs no sorting
+                self._sorted_devices = list(self._devices.values())
+            else:
+                # The dict is keyed by device hash, so sorting the keys avoids
+                # recomputing the hash of every device.
+                self._sorted_devices = [
+                    dev for _, dev in sorted(self._devices.items(), key=itemgetter(0))
+                ]
+        # Return a copy, so that callers can't modify the cached list
+        return list(self._sorted_devices)
 
     def matching_devices(self, patterns: list[str] | None) -> list[UsbDevice]:
         try:
-            matching = filter(
-                lambda dev: dev.is_match(patterns), self._devices.values()
-            )
-            return sorted(matching, key=lambda dev: dev.hash)
+            return [dev for dev in self.devices if dev.is_match(patterns)]
         except POSSIBLE_USB_ERRORS:
             return []
 
     def find_and_select_device(self, patterns: list[str] | None = None) -> UsbDevice:
-        devices = [
-            device for device in self.matching_devices(patterns) if device.is_supported
-        ]
-        if len(devices) == 0:
+        dev = None
+        other_devices: list[UsbDevice] = []
+        try:
+            # Check the cached product id before matching against the string
+            # descriptors, which may require USB control transfers.
+            candidates = (
+                candidate
+                for candidate in self.devices
+                if candidate.is_supported and candidate.is_match(patterns)
+            )
+            # Devices are sorted, so the first candidate is the one we select.
+            dev = next(candidates, None)
+            if dev is not None and LOG.isEnabledFor(logging.DEBUG):
+                # Only look for further matches when they are going to be logged.
+                other_devices = list(candidates)
+        except POSSIBLE_USB_ERRORS:
+            dev = None
+        if dev is None:
             raise DeviceManagerError("No matching devices found")
-        if len(devices) > 1:
-            LOG.debug("Found multiple matching Dymo devices. Using first device")
-        else:
-            LOG.debug("Found single device")
-        for dev in devices:
-            LOG.debug(dev.device_info)
-        dev = devices[0]
-        if dev.is_supported:
-            msg = f"Recognized device as {SUPPORTED_PRODUCTS[dev.id_product]}"
-        else:
-            msg = f"Unrecognized device: {hex(dev.id_product)}. {UNCONFIRMED_MESSAGE}"
-        LOG.debug(msg)
+        # Tell the user how to get access to the device, rather than failing later
+        dev.check_access()
+        if LOG.isEnabledFor(logging.DEBUG):
+            # device_info reads descriptors, so skip all of this unless it is logged
+            _log_selected_device(dev, other_devices)
         return dev
+
+
+def _log_selected_device(dev: UsbDevice, other_devices: list[UsbDevice]) -> None:
+    if other_devices:
+        LOG.debug("Found multiple matching Dymo devices. Using first device")
+    else:
+        LOG.debug("Found single device")
+    for matching_dev in (dev, *other_devices):
+        LOG.debug(matching_dev.device_info)
+    product_name = SUPPORTED_PRODUCTS.get(dev.id_product)
+    if product_name is not None:
+        msg = f"Recognized device as {product_name}"
+    else:
+        msg = f"Unrecognized device: {hex(dev.id_product)}. {UNCONFIRMED_MESSAGE}"
+    LOG.debug(msg)
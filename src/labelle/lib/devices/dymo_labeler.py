@@ -9,7 +9,7 @@ from __future__ import annotations
 
 import array
 import logging
-import math
+from functools import lru_cache
 
 import usb
 from PIL import Image
@@ -21,6 +21,7 @@ from labelle.lib.utils import mm_to_px
 
 LOG = logging.getLogger(__name__)
 POSSIBLE_USB_ERRORS = (UsbDeviceError, NoBackendError, USBError)
+_STATUS_REQUEST = bytes([ESC, ord("A")])
 
 
 class DymoLabelerDetectError(Exception):
@@ -35,6 +36,11 @@ class DymoLabelerPrintError(Exception):
         super().__init__(msg)
 
 
+@lru_cache
+def _get_chain_mark_line(bytes_per_line: int) -> bytes:
+    return bytes([0x99]) * bytes_per_line
+
+
 class DymoLabelerFunctions:
     """Create and work with a Dymo LabelManager PnP object.
 
@@ -68,7 +74,7 @@ class DymoLabelerFunctions:
         synwait: int | None = None,
     ):
         """Initialize the LabelManager object (HLF)."""
-        self._cmd: list[int] = []
+        self._cmd = bytearray()
         self._response = False
         self._bytesPerLine = None
         self._dotTab = 0
@@ -76,10 +82,12 @@ class DymoLabelerFunctions:
         self._devout = devout
         self._devin = devin
         self._synwait = synwait
+        # Reused for the responses to the status requests between chunks
+        self._handshake_buffer = array.array("B", bytes(512))
 
     @classmethod
     def _max_bytes_per_line(cls, tape_size_mm: int) -> int:
-        return int(8 * tape_size_mm / 12)
+        return 8 * tape_size_mm // 12
 
     @classmethod
     def height_px(cls, tape_size_mm: int):
@@ -90,57 +98,54 @@ class DymoLabelerFunctions:
         if len(self._cmd) == 0:
             return None
 
-        while len(self._cmd) > 0:
-            if self._synwait is None:
-                cmd_to_send = self._cmd
-                cmd_rest = []
-            else:
+        if self._synwait is None:
+            # Without synchronization, send the whole command in one bulk write
+            self._devout.write(self._cmd)
+        else:
+            self._send_command_in_chunks(self._synwait)
+
+        self._cmd = bytearray()
+        if not self._response:
+            return None
+        self._response = False
+        return self._devin.read(512)
+
+    def _send_command_in_chunks(self, synwait: int) -> None:
+        """Send the command in chunks of synwait lines, waiting for the device."""
+        sent = 0  # Index of the first byte of cmd which was not sent yet
+        with memoryview(self._cmd) as cmd:
+            while sent < len(cmd):
                 # Send a status request
-                cmdBin = array.array("B", [ESC, ord("A")])
-                cmdBin.tofile(self._devout)
-                rspBin = self._devin.read(512)
-                _ = array.array("B", rspBin).tolist()
+                self._devout.write(_STATUS_REQUEST)
+                self._devin.read(self._handshake_buffer)
                 # Ok, we got a response. Now we can send a chunk of data
 
                 # Compute a chunk with at most synwait SYN characters
                 synCount = 0  # Number of SYN characters encountered in iteration
-                pos = -1  # Index of last SYN character encountered in iteration
-                while synCount < self._synwait:
-                    try:
-                        # Increment pos to the index of the next SYN character
-                        pos += self._cmd[pos + 1 :].index(SYN) + 1
-                        synCount += 1
-                    except ValueError:
+                pos = sent - 1  # Index of last SYN character encountered in iteration
+                while synCount < synwait:
+                    # Find the index of the next SYN character without copying
+                    # the remainder of the command
+                    pos = self._cmd.find(SYN, pos + 1)
+                    if pos == -1:
                         # No more SYN characters in cmd
-                        pos = len(self._cmd)
+                        pos = len(cmd)
                         break
-                cmd_to_send = self._cmd[:pos]
-                cmd_rest = self._cmd[pos:]
-                LOG.debug(f"Sending chunk of {len(cmd_to_send)} bytes")
-
-            # Remove the computed chunk from the command to be processed
-            self._cmd = cmd_rest
-
-            # Send the chunk
-            cmdBin = array.array("B", cmd_to_send)
-            cmdBin.tofile(self._devout)
+                    synCount += 1
+                LOG.debug(f"Sending chunk of {pos - sent} bytes")
 
-        self._cmd = []  # This looks redundant.
-        if not self._response:
-            return None
-        self._response = False
-        responseBin = self._devin.read(512)
-        response = array.array("B", responseBin).tolist()
-        return response
+                # Send the chunk as a view into the command, without copying it
+                self._devout.write(cmd[sent:pos])
+                sent = pos
 
     def _reset_command(self) -> None:
         """Remove a partially built command (MLF)."""
-        self._cmd = []
+        self._cmd = bytearray()
         self._response = False
 
     def _build_command(self, cmd):
         """Add the next instruction to the command (MLF)."""
-        self._cmd += cmd
+        self._cmd.extend(cmd)
 
     def _status_request(self) -> None:
         """Set instruction to get the device's status (MLF)."""
@@ -177,25 +182,25 @@ class DymoLabelerFunctions:
         cmd = [ESC, ord("E")]
         self._build_command(cmd)
 
-    def _line(self, value) -> None:
+    def _line(self, value: bytes) -> None:
         """Set next printed line (MLF)."""
         self._bytes_per_line(len(value))
-        cmd = [SYN, *value]
-        self._build_command(cmd)
+        self._cmd.append(SYN)
+        self._cmd.extend(value)
 
     def _chain_mark(self, tape_size_mm: int) -> None:
         """Set Chain Mark (MLF)."""
+        max_bytes_per_line = self._max_bytes_per_line(tape_size_mm)
         self._dot_tab(0, tape_size_mm)
-        self._bytes_per_line(self._max_bytes_per_line(tape_size_mm))
-        self._line([0x99] * self._max_bytes_per_line(tape_size_mm))
+        self._bytes_per_line(max_bytes_per_line)
+        self._line(_get_chain_mark_line(max_bytes_per_line))
 
     def _skip_lines(self, value) -> None:
         """Set number of lines of white to print (MLF)."""
         if value <= 0:
             raise ValueError
         self._bytes_per_line(0)
-        cmd = [SYN] * value
-        self._build_command(cmd)
+        self._cmd.extend(bytes([SYN]) * value)
 
     def _init_label(self) -> None:
         """Set the label initialization sequence (MLF).
@@ -213,29 +218,50 @@ class DymoLabelerFunctions:
         self._status_request()
         return self._send_command()
 
-    def print_label(self, lines: list[list[int]]):
+    def print_label(self, lines: list[bytes]):
         """Print the label described by lines.
 
         Automatically split the label if it's larger than maxLines.
         """
-        while len(lines) > self._maxLines + 1:
-            self._raw_print_label(lines[0 : self._maxLines])
-            del lines[0 : self._maxLines]
-        self._raw_print_label(lines)
+        # Start from a clean state, this object may have printed a label before
+        self._reset_command()
+        self._bytesPerLine = None
+        offset = 0
+        while len(lines) - offset > self._maxLines + 1:
+            self._raw_print_label(lines[offset : offset + self._maxLines])
+            offset += self._maxLines
+        self._raw_print_label(lines[offset:])
 
-    def _raw_print_label(self, lines: list[list[int]]):
+    def _raw_print_label(self, lines: list[bytes]):
         """Print the label described by lines (HLF)."""
         # Here used to be a matrix optimization code that caused problems in issue #87
         self._tape_color(0)
+        # Inlined version of _line, as this loop runs for every printed line
+        cmd = self._cmd
+        bytes_per_line = self._bytesPerLine
         for line in lines:
-            self._line(line)
+            if len(line) != bytes_per_line:
+                bytes_per_line = len(line)
+                self._bytes_per_line(bytes_per_line)
+            cmd.append(SYN)
+            cmd.extend(line)
         self._status_request()
         status = self._get_status()
-        LOG.debug(f"Post-send response: {status}")
+        if LOG.isEnabledFor(logging.DEBUG):
+            LOG.debug(f"Post-send response: {bytes(status).hex(' ')}")
+
+
+@lru_cache
+def _get_labeler_margin_px(
+    horizontal_margin_mm: float, print_head_height_mm: float, tape_size_mm: int
+) -> tuple[float, float]:
+    vertical_margin_mm = max(0, (tape_size_mm - print_head_height_mm) / 2)
+    return mm_to_px(horizontal_margin_mm), mm_to_px(vertical_margin_mm)
 
 
 class DymoLabeler:
     _device: UsbDevice | None
+    _labeler_functions: DymoLabelerFunctions | None
     tape_size_mm: int
 
     LABELER_DISTANCE_BETWEEN_PRINT_HEAD_AND_CUTTER_MM = 8.1
@@ -257,6 +283,7 @@ class DymoLabeler:
             )
         self.tape_size_mm = tape_size_mm
         self._device = device
+        self._labeler_functions = None
 
     @property
     def height_px(self):
@@ -264,12 +291,14 @@ class DymoLabeler:
 
     @property
     def _functions(self) -> DymoLabelerFunctions:
-        assert self._device is not None
-        return DymoLabelerFunctions(
-            devout=self._device.devout,
-            devin=self._device.devin,
-            synwait=64,
-        )
+        if self._labeler_functions is None:
+            assert self._device is not None
+            self._labeler_functions = DymoLabelerFunctions(
+                devout=self._device.devout,
+                devin=self._device.devin,
+                synwait=64,
+            )
+        return self._labeler_functions
 
     @property
     def minimum_horizontal_margin_mm(self):
@@ -277,13 +306,10 @@ class DymoLabeler:
 
     @property
     def labeler_margin_px(self) -> tuple[float, float]:
-        vertical_margin_mm = max(
-            0, (self.tape_size_mm - self.LABELER_PRINT_HEAD_HEIGHT_MM) / 2
-        )
-
-        return (
-            mm_to_px(self.minimum_horizontal_margin_mm),
-            mm_to_px(vertical_margin_mm),
+        return _get_labeler_margin_px(
+            self.minimum_horizontal_margin_mm,
+            self.LABELER_PRINT_HEAD_HEIGHT_MM,
+            self.tape_size_mm,
         )
 
     @property
@@ -299,6 +325,7 @@ class DymoLabeler:
             device = None
             LOG.error(e)
         self._device = device
+        self._labeler_functions = None
 
     @property
     def is_ready(self) -> bool:
@@ -323,7 +350,7 @@ class DymoLabeler:
         stream: bytes = rotated_bitmap.tobytes()
 
         # Regather the bytes into rows
-        stream_row_length = int(math.ceil(bitmap.height / 8))
+        stream_row_length = (bitmap.height + 7) // 8
         if len(stream) // stream_row_length != bitmap.width:
             raise RuntimeError(
                 "An internal problem was encountered while processing the "
@@ -334,14 +361,9 @@ class DymoLabeler:
             for i in range(0, len(stream), stream_row_length)
         ]
 
-        # Convert bytes into ints
-        label_matrix: list[list[int]] = [
-            array.array("B", label_row).tolist() for label_row in label_rows
-        ]
-
         try:
             LOG.debug("Printing label..")
-            self._functions.print_label(label_matrix)
+            self._functions.print_label(label_rows)
             LOG.debug("Done printing.")
             if self._device is not None:
                 self._device.dispose()
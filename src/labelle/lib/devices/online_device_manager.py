@@ -3,21 +3,73 @@ from __future__ import annotations
 import logging
 
 from PyQt6 import QtCore
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer
 from PyQt6.QtWidgets import QWidget
-from usb.core import NoBackendError, USBError
 
 from labelle.lib.devices.device_manager import DeviceManager, DeviceManagerError
 from labelle.lib.devices.usb_device import UsbDevice
 
 LOG = logging.getLogger(__name__)
-POSSIBLE_USB_ERRORS = (NoBackendError, USBError)
+
+
+def _scan(device_manager: DeviceManager) -> tuple[bool, DeviceManagerError | None]:
+    try:
+        return device_manager.scan(), None
+    except DeviceManagerError as e:
+        return False, e
+
+
+def _error_key(
+    error: DeviceManagerError | None,
+) -> tuple[type[DeviceManagerError], tuple] | None:
+    """Identify an error for change detection without formatting its message."""
+    if error is None:
+        return None
+    return type(error), error.args
+
+
+class _ScanSignals(QObject):
+    finished = QtCore.pyqtSignal(bool, object, object)
+
+
+class _ScanRunnable(QRunnable):
+    """Scan for devices on a worker thread and report the result with a signal."""
+
+    def __init__(self, device_manager: DeviceManager, signals: _ScanSignals) -> None:
+        super().__init__()
+        self._device_manager = device_manager
+        self._signals = signals
+
+    def run(self) -> None:
+        changed = False
+        error: DeviceManagerError | None = None
+        devices: list[UsbDevice] = []
+        try:
+            known_hashes = {device.hash for device in self._device_manager.devices}
+            changed, error = _scan(self._device_manager)
+            devices = list(self._device_manager.devices)
+            if changed:
+                # The device selector shows product names. Reading them takes a USB
+                # control transfer per device, so do it here for new devices.
+                # UsbDevice caches them for the devices that were already known.
+                for device in devices:
+                    if device.hash not in known_hashes:
+                        _ = device.product
+        except Exception as e:
+            LOG.exception("Unexpected error while scanning devices")
+            error = DeviceManagerError(f"Failed scanning devices: {e}")
+        finally:
+            # Always report back, since no further scan starts until this one has
+            self._signals.finished.emit(changed, error, devices)
 
 
 class OnlineDeviceManager(QWidget):
     _last_scan_error: DeviceManagerError | None
     _status_time: QTimer
     _device_manager: DeviceManager
+    _devices: list[UsbDevice]
+    _scan_in_flight: bool
+    _scan_signals: _ScanSignals
     last_scan_error_changed_signal = QtCore.pyqtSignal(
         name="lastScanErrorChangedSignal"
     )
@@ -25,29 +77,58 @@ class OnlineDeviceManager(QWidget):
 
     def __init__(self) -> None:
         super().__init__()
+        # The device manager is only touched by one scan at a time; the GUI thread
+        # reads the snapshot in self._devices instead.
         self._device_manager = DeviceManager()
+        self._devices = []
         self._last_scan_error = None
+        self._scan_in_flight = False
+        self._scan_signals = _ScanSignals()
+        # The signal is emitted on a worker thread, so it is delivered queued
+        self._scan_signals.finished.connect(self._on_scan_finished)
         self._init_timers()
 
     def _refresh_devices(self) -> None:
+        # Scanning performs blocking USB I/O, so keep it off the GUI thread.
+        if self._scan_in_flight:
+            return
+        self._scan_in_flight = True
+        thread_pool = QThreadPool.globalInstance()
+        assert thread_pool is not None
+        thread_pool.start(_ScanRunnable(self._device_manager, self._scan_signals))
+
+    def _on_scan_finished(
+        self,
+        changed: bool,
+        error: DeviceManagerError | None,
+        devices: list[UsbDevice],
+    ) -> None:
+        self._scan_in_flight = False
+        self._update_scan_result(changed, error, devices)
+
+    def _update_scan_result(
+        self,
+        changed: bool,
+        error: DeviceManagerError | None,
+        devices: list[UsbDevice],
+    ) -> None:
         prev = self._last_scan_error
-        try:
-            changed = self._device_manager.scan()
-            self._last_scan_error = None
-            if changed:
-                self.devices_changed_signal.emit()
-        except DeviceManagerError as e:
-            self._last_scan_error = e
+        self._last_scan_error = error
+        self._devices = devices
 
-        if str(prev) != str(self._last_scan_error):
+        error_changed = _error_key(prev) != _error_key(self._last_scan_error)
+        if changed or error_changed:
             self.devices_changed_signal.emit()
+        if error_changed:
             self.last_scan_error_changed_signal.emit()
 
     def _init_timers(self) -> None:
         self._status_time = QTimer()
         self._status_time.timeout.connect(self._refresh_devices)
         self._status_time.start(2000)
-        self._refresh_devices()
+        # Scan once synchronously so that the initial state is known right away
+        changed, error = _scan(self._device_manager)
+        self._update_scan_result(changed, error, list(self._device_manager.devices))
 
     @property
     def last_scan_error(self) -> DeviceManagerError | None:
@@ -55,4 +136,4 @@ class OnlineDeviceManager(QWidget):
 
     @property
     def devices(self) -> list[UsbDevice]:
-        return self._device_manager.devices
+        return self._devices
@@ -0,0 +1,94 @@
+import logging
+import platform
+from types import SimpleNamespace
+
+import pytest
+import usb
+
+from labelle.lib.constants import DEV_VENDOR, SUPPORTED_PRODUCTS
+from labelle.lib.devices.device_manager import DeviceManager, DeviceManagerNoDevices
+from labelle.lib.devices.usb_device import UsbDeviceError
+
+
+def _make_usb_dev(address: int) -> SimpleNamespace:
+    return SimpleNamespace(bus=1, address=address, idVendor=DEV_VENDOR, idProduct=1)
+
+
+@pytest.fixture
+def attached(monkeypatch):
+    """List of the fake USB devices returned by usb.core.find."""
+    usb_devices: list[SimpleNamespace] = []
+
+    def find(find_all, custom_match):
+        assert find_all
+        return [dev for dev in usb_devices if custom_match(dev)]
+
+    monkeypatch.setattr(usb.core, "find", find)
+    return usb_devices
+
+
+def _addresses(device_manager: DeviceManager) -> list[int]:
+    return [device._dev.address for device in device_manager.devices]
+
+
+def test_scan_with_unchanged_topology(attached):
+    attached.append(_make_usb_dev(2))
+    device_manager = DeviceManager()
+
+    assert device_manager.scan()
+    devices = device_manager.devices
+    assert not device_manager.scan()
+    assert device_manager.devices == devices
+
+
+def test_scan_finds_added_devices(attached):
+    attached.append(_make_usb_dev(3))
+    device_manager = DeviceManager()
+    assert device_manager.scan()
+
+    attached.append(_make_usb_dev(2))
+    assert device_manager.scan()
+    assert _addresses(device_manager) == [2, 3]
+
+
+def test_scan_without_devices_clears_them(attached):
+    attached.append(_make_usb_dev(2))
+    device_manager = DeviceManager()
+    assert device_manager.scan()
+
+    attached.clear()
+    with pytest.raises(DeviceManagerNoDevices):
+        device_manager.scan()
+    assert device_manager.devices == []
+
+    attached.append(_make_usb_dev(2))
+    assert device_manager.scan()
+    assert _addresses(device_manager) == [2]
+
+
+def test_devices_are_not_modified_by_callers(attached):
+    attached.extend([_make_usb_dev(2), _make_usb_dev(3)])
+    device_manager = DeviceManager()
+    device_manager.scan()
+
+    device_manager.devices.reverse()
+    device_manager.devices.clear()
+    assert _addresses(device_manager) == [2, 3]
+
+
+def test_select_device_without_access_explains_setup(attached, monkeypatch, caplog):
+    def ctrl_transfer(**_kwargs):
+        raise usb.core.USBError("Access denied (insufficient permissions)", errno=13)
+
+    dev = _make_usb_dev(2)
+    dev.idProduct = next(iter(SUPPORTED_PRODUCTS))
+    dev.iManufacturer = 1
+    dev.ctrl_transfer = ctrl_transfer
+    attached.append(dev)
+    monkeypatch.setattr(platform, "system", lambda: "Linux")
+    caplog.set_level(logging.INFO)
+    device_manager = DeviceManager()
+    device_manager.scan()
+
+    with pytest.raises(UsbDeviceError, match="sufficient access"):
+        device_manager.find_and_select_device()
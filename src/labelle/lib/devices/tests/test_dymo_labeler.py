@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import array
+
+from PIL import Image
+
+from labelle.lib.constants import ESC, SYN
+from labelle.lib.devices.dymo_labeler import DymoLabeler
+
+STATUS_REQUEST = bytes([ESC, ord("A")])
+TAPE_COLOR_0 = bytes([ESC, ord("C"), 0])
+
+
+class FakeEndpointOut:
+    def __init__(self) -> None:
+        self.writes: list[bytes] = []
+
+    def write(self, data) -> int:
+        self.writes.append(bytes(data))
+        return len(data)
+
+
+class FakeEndpointIn:
+    def __init__(self) -> None:
+        self.reads = 0
+
+    def read(self, size_or_buffer: int | array.array) -> array.array | int:
+        self.reads += 1
+        if isinstance(size_or_buffer, array.array):
+            size_or_buffer[:8] = array.array("B", [0] * 8)
+            return 8
+        return array.array("B", [0] * 8)
+
+
+class FakeUsbDevice:
+    def __init__(self) -> None:
+        self.devout = FakeEndpointOut()
+        self.devin = FakeEndpointIn()
+        self.disposed = False
+
+    def dispose(self) -> None:
+        self.disposed = True
+
+
+def _print(bitmap: Image.Image, tape_size_mm: int = 12) -> FakeUsbDevice:
+    device = FakeUsbDevice()
+    labeler = DymoLabeler(tape_size_mm=tape_size_mm)
+    labeler._device = device  # type: ignore[assignment]
+    labeler.print(bitmap)
+    return device
+
+
+def _make_bitmap(width: int, height: int) -> Image.Image:
+    bitmap = Image.new("1", (width, height))
+    bitmap.putdata(
+        [(x * 7 + y * 3) % 5 == 0 for y in range(height) for x in range(width)]
+    )
+    return bitmap
+
+
+def _make_edge_bitmap(width: int) -> Image.Image:
+    """Set the first column and the bottom pixel of the last column."""
+    bitmap = Image.new("1", (width, 8))
+    bitmap.paste(1, (0, 0, 1, 8))
+    bitmap.putpixel((width - 1, 7), 1)
+    return bitmap
+
+
+def test_print_short_label_payload():
+    bitmap = Image.new("1", (2, 64))
+    bitmap.putpixel((0, 63), 1)
+    for y in range(64):
+        bitmap.putpixel((1, y), 1)
+
+    device = _print(bitmap)
+
+    expected_command = (
+        TAPE_COLOR_0
+        + bytes([ESC, ord("D"), 8])
+        + bytes([SYN, 0x80, 0, 0, 0, 0, 0, 0, 0])
+        + bytes([SYN, *[0xFF] * 8])
+        + STATUS_REQUEST
+        + STATUS_REQUEST
+    )
+    assert device.devout.writes == [STATUS_REQUEST, expected_command]
+    assert device.devin.reads == 2
+    assert device.disposed
+
+
+def test_print_label_of_max_lines_plus_one_in_one_job():
+    device = _print(_make_edge_bitmap(201))
+
+    blank_line = bytes([SYN, 0])
+    writes = device.devout.writes
+    # Each chunk follows a status request, and is cut before its 64th line
+    assert writes == [
+        STATUS_REQUEST,
+        TAPE_COLOR_0 + bytes([ESC, ord("D"), 1, SYN, 0xFF]) + blank_line * 62,
+        STATUS_REQUEST,
+        blank_line * 63,
+        STATUS_REQUEST,
+        blank_line * 63,
+        STATUS_REQUEST,
+        blank_line * 11 + bytes([SYN, 0x80]) + STATUS_REQUEST + STATUS_REQUEST,
+    ]
+
+
+def test_print_long_label_is_split_into_jobs():
+    device = _print(_make_edge_bitmap(203))
+
+    blank_line = bytes([SYN, 0])
+    writes = device.devout.writes
+    # The first job has 200 lines, the second one the remaining 3
+    assert writes == [
+        STATUS_REQUEST,
+        TAPE_COLOR_0 + bytes([ESC, ord("D"), 1, SYN, 0xFF]) + blank_line * 62,
+        STATUS_REQUEST,
+        blank_line * 63,
+        STATUS_REQUEST,
+        blank_line * 63,
+        STATUS_REQUEST,
+        blank_line * 11 + STATUS_REQUEST + STATUS_REQUEST,
+        STATUS_REQUEST,
+        TAPE_COLOR_0
+        + blank_line * 2
+        + bytes([SYN, 0x80])
+        + STATUS_REQUEST
+        + STATUS_REQUEST,
+    ]
+
+
+def test_print_twice_with_same_labeler():
+    bitmap = _make_bitmap(3, 64)
+    device = FakeUsbDevice()
+    labeler = DymoLabeler()
+    labeler._device = device  # type: ignore[assignment]
+
+    labeler.print(bitmap)
+    labeler.print(bitmap)
+
+    # Each label sets the line length again, it is not carried over
+    first, second = device.devout.writes[1], device.devout.writes[3]
+    assert first == second
+    assert first.startswith(TAPE_COLOR_0 + bytes([ESC, ord("D"), 8]))
@@ -0,0 +1,70 @@
+from labelle.lib.devices.device_manager import DeviceManagerError
+from labelle.lib.devices.online_device_manager import _ScanRunnable
+from labelle.lib.devices.usb_device import UsbDeviceError
+
+
+class FakeSignal:
+    def __init__(self):
+        self.emitted = []
+
+    def emit(self, *args):
+        self.emitted.append(args)
+
+
+class FakeSignals:
+    def __init__(self):
+        self.finished = FakeSignal()
+
+
+class FakeDevice:
+    def __init__(self, hash_: str):
+        self.hash = hash_
+        self.product_reads = 0
+
+    @property
+    def product(self):
+        self.product_reads += 1
+        return "LabelManager PnP"
+
+
+class FakeDeviceManager:
+    def __init__(self, devices):
+        self.devices = devices
+        self.next_devices = devices
+
+    def scan(self):
+        changed = self.next_devices != self.devices
+        self.devices = self.next_devices
+        return changed
+
+
+class FailingDeviceManager(FakeDeviceManager):
+    def scan(self):
+        raise UsbDeviceError("Could not get idProduct")
+
+
+def test_scan_runnable_reports_unexpected_errors():
+    signals = FakeSignals()
+    runnable = _ScanRunnable(FailingDeviceManager([]), signals)  # type: ignore[arg-type]
+
+    runnable.run()
+
+    [(changed, error, devices)] = signals.finished.emitted
+    assert not changed
+    assert isinstance(error, DeviceManagerError)
+    assert "Could not get idProduct" in str(error)
+    assert devices == []
+
+
+def test_scan_runnable_reads_product_of_new_devices_only():
+    old_device = FakeDevice("old")
+    new_device = FakeDevice("new")
+    device_manager = FakeDeviceManager([old_device])
+    device_manager.next_devices = [new_device, old_device]
+    signals = FakeSignals()
+
+    _ScanRunnable(device_manager, signals).run()  # type: ignore[arg-type]
+
+    assert signals.finished.emitted == [(True, None, [new_device, old_device])]
+    assert new_device.product_reads == 1
+    assert old_device.product_reads == 0
@@ -0,0 +1,46 @@
+import array
+
+from labelle.lib.devices.usb_device import UsbDevice
+
+
+class FakeDescriptorDevice:
+    """Answer string descriptor requests from a list of strings."""
+
+    def __init__(self, strings: list[str]):
+        self.iManufacturer = 1
+        self.iProduct = 2
+        self.iSerialNumber = 0
+        self._strings = strings
+        self.timeouts: list[int] = []
+
+    def ctrl_transfer(self, *, wValue, data_or_wLength, timeout, **_kwargs):
+        self.timeouts.append(timeout)
+        index = wValue & 0xFF
+        if index == 0:
+            data = (0x0409).to_bytes(2, "little")
+        else:
+            data = self._strings[index - 1].encode("utf-16-le")
+        return array.array("B", bytes([len(data) + 2, 3]) + data)[:data_or_wLength]
+
+
+def test_string_descriptors_are_read_with_a_timeout(monkeypatch):
+    monkeypatch.setenv("LABELLE_USB_TIMEOUT_MS", "50")
+    dev = FakeDescriptorDevice(["Dymo", "LabelManager PnP"])
+    device = UsbDevice(dev)  # type: ignore[arg-type]
+
+    assert device.manufacturer == "Dymo"
+    assert device.product == "LabelManager PnP"
+    assert device.serial_number is None
+    # The language id and the strings are only read once
+    assert device.product == "LabelManager PnP"
+    assert dev.timeouts == [50, 50, 50]
+
+
+def test_is_match_requires_every_pattern():
+    dev = FakeDescriptorDevice(["Dymo", "LabelManager PnP"])
+    device = UsbDevice(dev)  # type: ignore[arg-type]
+
+    assert device.is_match(None)
+    assert device.is_match(["dymo"])
+    assert device.is_match(["DYMO", "pnp"])
+    assert not device.is_match(["dymo", "280"])
@@ -13,6 +13,7 @@ from labelle.lib.constants import (
     PRINTER_INTERFACE_CLASS,
     SUPPORTED_PRODUCTS,
 )
+from labelle.lib.env_config import get_usb_descriptor_timeout_ms
 
 LOG = logging.getLogger(__name__)
 GITHUB_ISSUE_MAC = "<https://github.com/labelle-org/labelle/issues/5>"
@@ -23,17 +24,36 @@ class UsbDeviceError(RuntimeError):
     pass
 
 
+class _TimeoutControlTransfers:
+    """Let usb.util read descriptors of a device with the given timeout."""
+
+    def __init__(self, dev: usb.core.Device, timeout_ms: int) -> None:
+        self._dev = dev
+        self._timeout_ms = timeout_ms
+
+    def ctrl_transfer(self, *args: Any, **kwargs: Any) -> Any:
+        return self._dev.ctrl_transfer(*args, timeout=self._timeout_ms, **kwargs)
+
+
 class UsbDevice:
+    __slots__ = ("_dev", "_devin", "_devout", "_intf", "_langid", "_strings", "_usb_id")
+
     _dev: usb.core.Device
     _intf: usb.core.Interface | None
     _devin: usb.core.Endpoint | None
     _devout: usb.core.Endpoint | None
+    _langid: int | None
+    _strings: dict[str, str | None]
+    _usb_id: str | None
 
     def __init__(self, dev: usb.core.Device) -> None:
         self._dev = dev
         self._intf = None
         self._devin = None
         self._devout = None
+        self._langid = None
+        self._strings = {}
+        self._usb_id = None
 
     @property
     def hash(self) -> str:
@@ -45,17 +65,53 @@ class UsbDevice:
         except (ValueError, usb.core.USBError):
             return None
 
+    def _get_string_descriptor(self, index_attr: str) -> str | None:
+        try:
+            return self._read_string_descriptor(index_attr)
+        except (ValueError, usb.core.USBError):
+            return None
+
+    def _read_string_descriptor(self, index_attr: str) -> str | None:
+        # Like pyusb's string properties, cache successful reads and retry failed
+        # ones on the next access.
+        if index_attr in self._strings:
+            return self._strings[index_attr]
+        # pyusb reads string descriptors with the device's default timeout. A short
+        # timeout keeps an unresponsive device from blocking a device listing, but
+        # it must not be set on the device, since it is shared with the bulk
+        # transfers made while printing from another thread.
+        dev = _TimeoutControlTransfers(self._dev, get_usb_descriptor_timeout_ms())
+        if self._langid is None:
+            try:
+                langids = usb.util.get_langids(dev)
+            except usb.core.USBError:
+                # Same as Device.langids, which also hides the error
+                langids = ()
+            if not langids:
+                raise ValueError("The device has no langid")
+            self._langid = langids[0]
+        string = usb.util.get_string(dev, getattr(self._dev, index_attr), self._langid)
+        self._strings[index_attr] = string
+        return string
+
+    def check_access(self) -> None:
+        """Explain how to get access to the device if its descriptors can't be read."""
+        try:
+            self._read_string_descriptor("iManufacturer")
+        except ValueError:
+            self._instruct_on_access_denied()
+
     @property
     def manufacturer(self) -> str | None:
-        return self._get_dev_attribute("manufacturer")
+        return self._get_string_descriptor("iManufacturer")
 
     @property
     def product(self) -> str | None:
-        return self._get_dev_attribute("product")
+        return self._get_string_descriptor("iProduct")
 
     @property
     def serial_number(self) -> str | None:
-        return self._get_dev_attribute("serial_number")
+        return self._get_string_descriptor("iSerialNumber")
 
     @property
     def id_vendor(self) -> int:
@@ -77,9 +133,15 @@ class UsbDevice:
 
     @property
     def usb_id(self) -> str:
-        bus = self._get_dev_attribute("bus")
-        address = self._get_dev_attribute("address")
-        return f"Bus {bus:03} Device {address:03}: ID {self.vendor_product_id}"
+        # Bus, address and ids don't change for the lifetime of a device, and
+        # this is used as the device hash on every scan.
+        if self._usb_id is None:
+            bus = self._get_dev_attribute("bus")
+            address = self._get_dev_attribute("address")
+            self._usb_id = (
+                f"Bus {bus:03} Device {address:03}: ID {self.vendor_product_id}"
+            )
+        return self._usb_id
 
     @staticmethod
     def _is_supported_vendor(dev: usb.core.Device) -> bool:
@@ -87,42 +149,39 @@ class UsbDevice:
 
     @property
     def is_supported(self) -> bool:
-        return (
-            self._is_supported_vendor(self._dev)
-            and self.id_product in SUPPORTED_PRODUCTS
+        dev = self._dev
+        return dev.idVendor == DEV_VENDOR and dev.idProduct in SUPPORTED_PRODUCTS
+
+    @staticmethod
+    def find_supported_usb_devices() -> list[usb.core.Device]:
+        return list(
+            usb.core.find(find_all=True, custom_match=UsbDevice._is_supported_vendor)
         )
 
     @staticmethod
     def supported_devices() -> set[UsbDevice]:
-        return {
-            UsbDevice(dev)
-            for dev in usb.core.find(
-                find_all=True, custom_match=UsbDevice._is_supported_vendor
-            )
-        }
+        return {UsbDevice(dev) for dev in UsbDevice.find_supported_usb_devices()}
 
     @property
     def device_info(self) -> str:
-        try:
-            _ = self._dev.manufacturer
-        except ValueError:
-            self._instruct_on_access_denied()
-        res = ""
-        res += f"{self._dev!r}\n"
-        res += f"  manufacturer: {self._dev.manufacturer}\n"
-        res += f"  product: {self._dev.product}\n"
-        res += f"  serial: {self._dev.serial_number}\n"
+        self.check_access()
+        lines = [
+            f"{self._dev!r}",
+            f"  manufacturer: {self.manufacturer}",
+            f"  product: {self.product}",
+            f"  serial: {self.serial_number}",
+        ]
         configs = self._dev.configurations()
         if configs:
-            res += "  configurations:\n"
+            lines.append("  configurations:")
             for cfg in configs:
-                res += f"  - {cfg!r}\n"
+                lines.append(f"  - {cfg!r}")
                 intfs = cfg.interfaces()
                 if intfs:
-                    res += "    interfaces:\n"
-                    for intf in intfs:
-                        res += f"    - {intf!r}\n"
-        return res
+                    lines.append("    interfaces:")
+                    lines.extend(f"    - {intf!r}" for intf in intfs)
+        lines.append("")
+        return "\n".join(lines)
 
     def _instruct_on_access_denied(self) -> NoReturn:
         system = platform.system()
@@ -222,17 +281,12 @@ class UsbDevice:
 
     def _setup(self):
         self._set_configuration()
-        intf = usb.util.find_descriptor(
-            self._dev.get_active_configuration(),
-            bInterfaceClass=PRINTER_INTERFACE_CLASS,
-        )
+        cfg = self._dev.get_active_configuration()
+        intf = usb.util.find_descriptor(cfg, bInterfaceClass=PRINTER_INTERFACE_CLASS)
         if intf is not None:
             LOG.debug(f"Opened printer interface: {intf!r}")
         else:
-            intf = usb.util.find_descriptor(
-                self._dev.get_active_configuration(),
-                bInterfaceClass=HID_INTERFACE_CLASS,
-            )
+            intf = usb.util.find_descriptor(cfg, bInterfaceClass=HID_INTERFACE_CLASS)
             if intf is not None:
                 LOG.debug(f"Opened HID interface: {intf!r}")
             else:
@@ -249,20 +303,7 @@ class UsbDevice:
             LOG.debug(
                 f"Kernel driver detaching not necessary on " f"{platform.system()}."
             )
-        devout = usb.util.find_descriptor(
-            intf,
-            custom_match=(
-                lambda e: usb.util.endpoint_direction(e.bEndpointAddress)
-                == usb.util.ENDPOINT_OUT
-            ),
-        )
-        devin = usb.util.find_descriptor(
-            intf,
-            custom_match=(
-                lambda e: usb.util.endpoint_direction(e.bEndpointAddress)
-                == usb.util.ENDPOINT_IN
-            ),
-        )
+        devout, devin = self._find_endpoints(intf)
 
         if not devout or not devin:
             self._intf = None
@@ -273,21 +314,40 @@ class UsbDevice:
         self._devin = devin
         self._devout = devout
 
+    @staticmethod
+    def _find_endpoints(
+        intf: usb.core.Interface,
+    ) -> tuple[usb.core.Endpoint | None, usb.core.Endpoint | None]:
+        """Find the first OUT and IN endpoints of the interface in a single pass."""
+        endpoint_direction = usb.util.endpoint_direction
+        devout = devin = None
+        for endpoint in intf:
+            direction = endpoint_direction(endpoint.bEndpointAddress)
+            if direction == usb.util.ENDPOINT_OUT:
+                if devout is None:
+                    devout = endpoint
+            elif devin is None:
+                devin = endpoint
+            if devout is not None and devin is not None:
+                break
+        return devout, devin
+
     def dispose(self) -> None:
         usb.util.dispose_resources(self._dev)
 
     def is_match(self, patterns: list[str] | None) -> bool:
-        if patterns is None:
+        if not patterns:
             return True
-        match = True
-        for pattern in patterns:
-            pattern = pattern.lower()
-            match &= (
-                pattern in (self.manufacturer or "").lower()
-                or pattern in (self.product or "").lower()
-                or pattern in (self.serial_number or "").lower()
-            )
-        return match
+        # Read each string descriptor once, rather than once per pattern. Reading
+        # an inaccessible descriptor is retried on every access.
+        fields = [
+            (self.manufacturer or "").lower(),
+            (self.product or "").lower(),
+            (self.serial_number or "").lower(),
+        ]
+        return all(
+            any(pattern.lower() in field for field in fields) for pattern in patterns
+        )
 
     @property
     def devin(self):
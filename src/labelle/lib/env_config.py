@@ -1,6 +1,10 @@
 import os
+from functools import lru_cache
 
 
+# The environment is not expected to change while labelle runs, and some of these
+# are checked for every rendered label.
+@lru_cache
 def is_env_var_true(env_var: str) -> bool:
     val = os.getenv(env_var)
     return val is not None and val.lower() in ("1", "true")
@@ -12,3 +16,14 @@ def is_dev_mode_no_margins() -> bool:
 
 def is_verbose_env_vars() -> bool:
     return is_env_var_true("LABELLE_VERBOSE")
+
+
+def get_usb_descriptor_timeout_ms() -> int:
+    default = 200
+    val = os.getenv("LABELLE_USB_TIMEOUT_MS")
+    try:
+        timeout_ms = int(val) if val else default
+    except ValueError:
+        return default
+    # pyusb treats a timeout of 0 as infinite, and rejects negative timeouts
+    return timeout_ms if timeout_ms > 0 else default
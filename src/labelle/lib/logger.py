@@ -2,6 +2,7 @@ import logging
 import sys
 
 _IS_VERBOSE = True
+_IS_CONFIGURED = False
 LOG = logging.getLogger("labelle")
 VERBOSE_NOTICE = "Run with --verbose for more information"
 
@@ -21,11 +22,16 @@ def is_verbose() -> bool:
 
 
 def configure_logging() -> None:
+    global _IS_CONFIGURED
+    _update_log_level()
+    if _IS_CONFIGURED:
+        # Adding another handler would emit every message once more
+        return
+    _IS_CONFIGURED = True
+
     handler = logging.StreamHandler(sys.stderr)
     formatter = logging.Formatter("[%(levelname)s] %(message)s")
     handler.setFormatter(formatter)
-
-    _update_log_level()
     LOG.addHandler(handler)
 
 
@@ -13,13 +13,12 @@ def output_bitmap(bitmap: Image.Image, output: Output):
         label_rotated = bitmap.transpose(Image.Transpose.ROTATE_270)
         invert = output == Output.CONSOLE_INVERTED
         typer.echo(image_to_unicode(label_rotated, invert=invert))
-    if output == Output.IMAGEMAGICK:
+    elif output == Output.IMAGEMAGICK:
         ImageOps.invert(bitmap.convert("RGB")).show()
-    if output == Output.BROWSER:
+    elif output == Output.BROWSER:
         with NamedTemporaryFile(suffix=".png", delete=False) as fp:
-            inverted = ImageOps.invert(bitmap.convert("RGB"))
-            ImageOps.invert(inverted).save(fp)
+            bitmap.convert("RGB").save(fp)
             webbrowser.open(f"file://{fp.name}")
-    if output == Output.PNG:
+    elif output == Output.PNG:
         bitmap.save("output.png")
         typer.echo("Saved output.png")
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 import barcode as barcode_module
 from PIL import Image
 
@@ -43,16 +45,26 @@ class BarcodeRenderEngine(RenderEngine):
             # the default code, we really don't want to trigger a popup
             # in the GUI before the user entered a barcode.
             self.content = " "
-        try:
-            code_obj = barcode_module.get(
-                self.barcode_type, self.content, writer=SimpleBarcodeWriter()
-            )
-            result = code_obj.render()
-        except BaseException as e:
-            raise BarcodeRenderError(e) from e
-        bitmap = convert_binary_string_to_barcode_image(
-            line=result.line,
-            quiet_zone=result.quiet_zone,
-            module_height=context.height_px - 16,
+        bitmap = _render_barcode(
+            self.content, self.barcode_type, module_height=context.height_px - 16
         )
-        return bitmap
+        # The cached bitmap is shared, and callers may draw onto the result
+        return bitmap.copy()
+
+
+@lru_cache(maxsize=64)
+def _render_barcode(
+    content: str, barcode_type: BarcodeType, module_height: int
+) -> Image.Image:
+    try:
+        code_obj = barcode_module.get(
+            barcode_type, content, writer=SimpleBarcodeWriter()
+        )
+        result = code_obj.render()
+    except BaseException as e:
+        raise BarcodeRenderError(e) from e
+    return convert_binary_string_to_barcode_image(
+        line=result.line,
+        quiet_zone=result.quiet_zone,
+        module_height=module_height,
+    )
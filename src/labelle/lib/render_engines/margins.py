@@ -118,10 +118,15 @@ class MarginsRenderEngine(RenderEngine):
             )
             vertical_offset_px = self.labeler_vertical_margin_px
 
-        bitmap = Image.new("1", (math.ceil(label_width_px), math.ceil(bitmap_height)))
-        bitmap.paste(
-            payload_bitmap, box=(round(horizontal_offset_px), round(vertical_offset_px))
-        )
+        size = (math.ceil(label_width_px), math.ceil(bitmap_height))
+        box = (round(horizontal_offset_px), round(vertical_offset_px))
+        if payload_bitmap.mode == "1" and size == payload_bitmap.size and box == (0, 0):
+            # There are no margins to add, so pasting would only copy the payload.
+            # Still copy it, the inner engine may return a shared bitmap.
+            bitmap = payload_bitmap.copy()
+        else:
+            bitmap = Image.new("1", size)
+            bitmap.paste(payload_bitmap, box=box)
         meta = {
             "horizontal_offset_px": horizontal_offset_px,
             "vertical_offset_px": vertical_offset_px,
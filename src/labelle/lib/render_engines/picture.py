@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 from pathlib import Path
 
 from PIL import Image, ImageOps, UnidentifiedImageError
@@ -34,14 +35,23 @@ class PictureRenderEngine(RenderEngine):
             )
 
     def render(self, context: RenderContext) -> Image.Image:
-        height_px = context.height_px
-        try:
-            with Image.open(self.picture_path) as img:
-                if img.height > height_px:
-                    ratio = height_px / img.height
-                    img = img.resize((int(math.ceil(img.width * ratio)), height_px))
-
-                img = img.convert("L", palette=Image.AFFINE)
-                return ImageOps.invert(img).convert("1")
-        except UnidentifiedImageError as e:
-            raise UnidentifiedImageFileError(e) from e
+        # The modification time is part of the cache key, so that an edited
+        # picture is loaded again.
+        mtime_ns = self.picture_path.stat().st_mtime_ns
+        bitmap = _render_picture(self.picture_path, mtime_ns, context.height_px)
+        # The cached bitmap is shared, and callers may draw onto the result
+        return bitmap.copy()
+
+
+@lru_cache(maxsize=32)
+def _render_picture(picture_path: Path, mtime_ns: int, height_px: int) -> Image.Image:
+    try:
+        with Image.open(picture_path) as img:
+            if img.height > height_px:
+                ratio = height_px / img.height
+                img = img.resize((int(math.ceil(img.width * ratio)), height_px))
+
+            img = img.convert("L")
+            return ImageOps.invert(img).convert("1")
+    except UnidentifiedImageError as e:
+        raise UnidentifiedImageFileError(e) from e
@@ -7,7 +7,6 @@ from labelle.lib.render_engines.render_engine import (
     RenderEngine,
     RenderEngineException,
 )
-from labelle.lib.utils import draw_image, scaling
 
 
 class QrTooBigError(RenderEngineException):
@@ -41,13 +40,11 @@ class QrRenderEngine(RenderEngine):
 
         bitmap = Image.new("1", (label_width_px, height_px))
 
-        with draw_image(bitmap) as draw:
-            # write the qr-code into the empty image
-            for i, line in enumerate(qr_text_lines):
-                for j, char in enumerate(line):
-                    if char == "1":
-                        qr_pixels = scaling(
-                            (j * qr_scale, i * qr_scale + qr_offset), qr_scale
-                        )
-                        draw.point(qr_pixels, 1)
+        # write the qr-code into the empty image, filling each module as a square
+        for i, line in enumerate(qr_text_lines):
+            y = i * qr_scale + qr_offset
+            for j, char in enumerate(line):
+                if char == "1":
+                    x = j * qr_scale
+                    bitmap.paste(1, (x, y, x + qr_scale, y + qr_scale))
         return bitmap
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 import math
+from functools import lru_cache
 
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageFont
 
 from labelle.lib.font_config import get_font_path
 from labelle.lib.render_engines import RenderContext, RenderEngine
@@ -14,30 +15,49 @@ from labelle.lib.utils import draw_image
 FONT_SIZE_PX = 12
 
 
-class SamplePatternRenderEngine(HorizontallyCombinedRenderEngine):
+class SamplePatternRenderEngine(RenderEngine):
     def __init__(self, height: int = 100):
-        four_horizontal_lines_top_and_bottom = (
-            _make_staggered_horizontal_lines_top_bottom(
-                num_lines=4, width=40, height=height
-            )
-        )
-        vertical_lines = _make_vertical_lines(num_lines=5, height=height)
-        fine_checkerboard_pattern = _make_fine_checkerboard_pattern(
-            width=12, height=height
-        )
-        solid_black = _make_solid_black(width=12, height=height)
-        dyadic_checkerboard_pattern = _make_dyadic_checkerboard_pattern(height=height)
-
-        bitmaps = [
-            four_horizontal_lines_top_and_bottom,
-            vertical_lines,
-            fine_checkerboard_pattern,
-            solid_black,
-            dyadic_checkerboard_pattern,
-            four_horizontal_lines_top_and_bottom,
-        ]
-        render_engines = [_ImageRenderEngine(bitmap) for bitmap in bitmaps]
-        super().__init__(render_engines=render_engines, padding=0)
+        super().__init__()
+        self.height = height
+
+    def render(self, _: RenderContext) -> Image.Image:
+        # The cached bitmap is shared, and callers may draw onto the result
+        return _render_sample_pattern(self.height).copy()
+
+
+@lru_cache(maxsize=8)
+def _render_sample_pattern(height: int) -> Image.Image:
+    # The pattern only depends on the height, not on the render context
+    bitmaps = _make_sample_bitmaps(height)
+    render_engine = HorizontallyCombinedRenderEngine(
+        render_engines=[_ImageRenderEngine(bitmap) for bitmap in bitmaps],
+        padding=0,
+    )
+    return render_engine.render(RenderContext(height_px=height))
+
+
+def _make_sample_bitmaps(height: int) -> tuple[Image.Image, ...]:
+    four_horizontal_lines_top_and_bottom = _make_staggered_horizontal_lines_top_bottom(
+        num_lines=4, width=40, height=height
+    )
+    vertical_lines = _make_vertical_lines(num_lines=5, height=height)
+    fine_checkerboard_pattern = _make_fine_checkerboard_pattern(width=12, height=height)
+    solid_black = _make_solid_black(width=12, height=height)
+    dyadic_checkerboard_pattern = _make_dyadic_checkerboard_pattern(height=height)
+
+    return (
+        four_horizontal_lines_top_and_bottom,
+        vertical_lines,
+        fine_checkerboard_pattern,
+        solid_black,
+        dyadic_checkerboard_pattern,
+        four_horizontal_lines_top_and_bottom,
+    )
+
+
+@lru_cache
+def _get_font() -> ImageFont.FreeTypeFont:
+    return ImageFont.truetype(str(get_font_path(style="regular")), FONT_SIZE_PX)
 
 
 class _ImageRenderEngine(RenderEngine):
@@ -53,30 +73,27 @@ def _make_vertical_lines(*, num_lines: int, height: int) -> Image.Image:
     width = 2 * num_lines - 1
     image = Image.new("1", (width, height))
     for x in range(0, width, 2):
-        for y in range(height):
-            image.putpixel((x, y), 1)
+        image.paste(1, (x, 0, x + 1, height))
     return image
 
 
 def _make_staggered_horizontal_lines_top_bottom(
     *, num_lines: int, width: int, height: int
 ) -> Image.Image:
-    image = Image.new("1", (40, height))
+    image = Image.new("1", (width, height))
+    # Lines are drawn one pixel lower in one half than in the other
+    half_width = math.ceil(width / 2)
     # top
     for y0 in range(0, 2 * num_lines, 2):
-        for x in range(width):
-            y = y0 if x < width / 2 else y0 + 1
-            image.putpixel((x, y), 1)
+        image.paste(1, (0, y0, half_width, y0 + 1))
+        image.paste(1, (half_width, y0 + 1, width, y0 + 2))
     # bottom
     for y0 in range(height - 2 * num_lines, height, 2):
-        for x in range(40):
-            y = y0 + 1 if x < width / 2 else y0
-            image.putpixel((x, y), 1)
+        image.paste(1, (0, y0 + 1, half_width, y0 + 2))
+        image.paste(1, (half_width, y0, width, y0 + 1))
     # draw height
-    font_path = get_font_path(style="regular")
-    font = ImageFont.truetype(str(font_path), FONT_SIZE_PX)
+    font = _get_font()
     with draw_image(image) as draw:
-        assert isinstance(draw, ImageDraw.ImageDraw)
         text = f"h={height}"
         _left, _top, _right, text_height = font.getbbox(text)
         y = (height - text_height) // 2
@@ -86,23 +103,24 @@ def _make_staggered_horizontal_lines_top_bottom(
 
 
 def _make_fine_checkerboard_pattern(*, width: int, height: int) -> Image.Image:
-    image = Image.new("1", (width, height))
-    for x in range(0, width):
-        for y in range(0, height):
-            if (x + y) % 2 == 0:
-                image.putpixel((x, y), 1)
-    return image
+    # Build the packed rows directly: pixels where x + y is even are set, so even
+    # rows start with a set pixel (0b1010...) and odd rows with a clear one.
+    row_length = (width + 7) // 8
+    even_row = b"\xaa" * row_length
+    odd_row = b"\x55" * row_length
+    data = (even_row + odd_row) * (height // 2) + even_row * (height % 2)
+    return Image.frombytes("1", (width, height), data)
 
 
 def _make_dyadic_checkerboard_pattern(*, height: int) -> Image.Image:
-    font_path = get_font_path(style="regular")
-    font = ImageFont.truetype(str(font_path), FONT_SIZE_PX)
+    font = _get_font()
     _left, _top, _right, font_height = font.getbbox("0123456789")
     MARGIN_BELOW = 3  # One pixel above plus two pixels below the text.
 
     # Font block size is the first power of two greater than the required height.
-    log_font_block_size = math.ceil(math.log2(font_height + MARGIN_BELOW))
-    font_block_size = 2**log_font_block_size
+    # getbbox is typed as returning floats, but it returns whole pixels here
+    log_font_block_size = (int(font_height) + MARGIN_BELOW - 1).bit_length()
+    font_block_size = 1 << log_font_block_size
 
     required_text_width = _get_required_text_width(
         font=font, height=height, log_font_block_size=log_font_block_size
@@ -113,31 +131,34 @@ def _make_dyadic_checkerboard_pattern(*, height: int) -> Image.Image:
     image = Image.new("1", (image_width, height))
 
     # Draw text
-    for yc in range(font_block_size, height + 1, font_block_size):
-        text = str(yc)
-        y = height - yc - 1
-        with draw_image(image) as draw:
-            assert isinstance(draw, ImageDraw.ImageDraw)
+    with draw_image(image) as draw:
+        for yc in range(font_block_size, height + 1, font_block_size):
+            text = str(yc)
+            y = height - yc - 1
             draw.text((text_x_offset + 1, y + 2), text, font=font, fill=1)
 
-    # Draw checkerboard pattern
-    for yc in range(0, height):
-        y = height - yc - 1
-        for x in range(image_width):
-            x0 = min(x // font_block_size, log_font_block_size)
-            # Get the x0-th bit of yc
-            if (yc >> x0) & 1 == 0:
-                if image.getpixel((x, y)) == 1:
-                    image.putpixel((x, y), 0)
-                else:
-                    image.putpixel((x, y), 1)
-    return image
+    # Draw checkerboard pattern, inverting the text where it overlaps
+    checkerboard = Image.new("1", (image_width, height))
+    for x0 in range(log_font_block_size + 1):
+        # The x0-th block of columns shows the x0-th bit of yc, counting yc from the
+        # bottom row. The last block extends to the right edge, behind the text.
+        x_start = x0 * font_block_size
+        if x0 < log_font_block_size:
+            x_end = x_start + font_block_size
+        else:
+            x_end = image_width
+        # Fill the runs of rows where the x0-th bit of yc is 0
+        run_length = 1 << x0
+        for yc_start in range(0, height, 2 * run_length):
+            yc_end = min(yc_start + run_length, height)
+            checkerboard.paste(1, (x_start, height - yc_end, x_end, height - yc_start))
+    return ImageChops.logical_xor(image, checkerboard)
 
 
 def _get_required_text_width(
     *, font: ImageFont.FreeTypeFont, height: int, log_font_block_size: int
 ) -> int:
-    font_block_size = 2**log_font_block_size
+    font_block_size = 1 << log_font_block_size
     required_text_width = 0
     for yc in range(font_block_size, height + 1, font_block_size):
         text = str(yc)
@@ -1,5 +1,6 @@
 from pathlib import Path
 
+import PIL.Image
 import PIL.ImageOps
 import pytest
 
@@ -10,12 +11,14 @@ from labelle.lib.render_engines import (
     BarcodeWithTextRenderEngine,
     EmptyRenderEngine,
     HorizontallyCombinedRenderEngine,
+    MarginsRenderEngine,
     NoContentError,
     PicturePathDoesNotExist,
     PictureRenderEngine,
     QrRenderEngine,
     QrTooBigError,
     RenderContext,
+    RenderEngine,
     SamplePatternRenderEngine,
     TextRenderEngine,
     UnidentifiedImageFileError,
@@ -188,6 +191,31 @@ def test_horizontally_combined_render_engine_empty(request, image_diff):
     verify_image(request, image_diff, image)
 
 
+#######################
+# MarginsRenderEngine #
+#######################
+
+
+class FixedRenderEngine(RenderEngine):
+    def __init__(self, image):
+        super().__init__()
+        self.image = image
+
+    def render(self, _):
+        return self.image
+
+
+def test_margins_render_engine_without_margins_returns_a_copy():
+    payload = PIL.Image.new("1", (10, 100))
+    render_engine = MarginsRenderEngine(FixedRenderEngine(payload), mode="print")
+
+    image, _meta = render_engine.render_with_meta(RENDER_CONTEXT)
+    image.putpixel((0, 0), 1)
+
+    assert image.size == payload.size
+    assert payload.getbbox() is None
+
+
 #######################
 # PictureRenderEngine #
 #######################
@@ -0,0 +1,19 @@
+import pytest
+
+from labelle.lib.env_config import get_usb_descriptor_timeout_ms
+
+
+def test_usb_descriptor_timeout_defaults_when_unset(monkeypatch):
+    monkeypatch.delenv("LABELLE_USB_TIMEOUT_MS", raising=False)
+    assert get_usb_descriptor_timeout_ms() == 200
+
+
+def test_usb_descriptor_timeout_from_env(monkeypatch):
+    monkeypatch.setenv("LABELLE_USB_TIMEOUT_MS", "500")
+    assert get_usb_descriptor_timeout_ms() == 500
+
+
+@pytest.mark.parametrize("value", ["", "fast", "1.5", "0", "-5"])
+def test_usb_descriptor_timeout_rejects_invalid_values(monkeypatch, value):
+    monkeypatch.setenv("LABELLE_USB_TIMEOUT_MS", value)
+    assert get_usb_descriptor_timeout_ms() == 200
@@ -9,7 +9,7 @@ import contextlib
 import logging
 import math
 import sys
-from typing import Generator, List, Tuple
+from typing import Generator
 
 from PIL import ImageDraw
 
@@ -19,19 +19,9 @@ from labelle.lib.logger import print_exception
 LOG = logging.getLogger(__name__)
 
 
-def scaling(pix, sc) -> List[Tuple[int, int]]:
-    """Scaling pixel up, input: (x,y),scale-factor."""
-    return [(pix[0] + i, pix[1] + j) for i in range(sc) for j in range(sc)]
-
-
 @contextlib.contextmanager
 def draw_image(bitmap) -> Generator[ImageDraw.ImageDraw, None, None]:
-    drawobj = ImageDraw.Draw(bitmap)
-    assert isinstance(drawobj, ImageDraw.ImageDraw)
-    try:
-        yield drawobj
-    finally:
-        del drawobj
+    yield ImageDraw.Draw(bitmap)
 
 
 def px_to_mm(px) -> float: